@@ -1,6 +1,5 @@
 import dash
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html
 from dash.dependencies import Input, Output
 from dash.exceptions import PreventUpdate
 
@@ -19,6 +18,7 @@ class DashApp:
         self.field_minmax = {}
         self.minmax_decay = 0.975
         self.play_status = None
+        self.component_cache = {}  # builder name -> layout that only depends on the model
         
         # The index page encapsulates the specific pages.
         self.dash.layout = html.Div([
@@ -1,7 +1,6 @@
 import warnings
 
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html
 from dash.dependencies import Output
 
 from .board import build_benchmark, build_system_controls, \
@@ -10,7 +9,7 @@ from .log import build_log
 from .model_controls import build_model_controls
 from .viewsettings import build_view_selection, refresh_rate_ms, REFRESH_RATE
 from .dash_app import DashApp
-from .info import build_app_details, build_description, build_phiflow_info, build_app_time
+from .info import build_static_info, build_description, build_app_time
 from .viewer import build_viewers, REFRESH_INTERVAL
 from .player_controls import build_status_bar, build_player_controls, PLAYING, STEP_COMPLETE
 from .._vis_base import Gui, VisModel
@@ -114,8 +113,7 @@ class DashGui(Gui):
             build_description(dash_app),
             status_bar,
             player_controls,
-            build_phiflow_info(dash_app),
-            build_app_details(dash_app),
+            build_static_info(dash_app),
             build_app_time(dash_app),
         ])
         dash_app.add_page('/info', layout)
@@ -1,83 +1,110 @@
 # coding=utf-8
-import inspect
-import datetime
-from os.path import dirname, join
+import time
+from functools import lru_cache, wraps
 
-import dash_core_components as dcc
-import dash_html_components as html
-import socket
-from dash.dependencies import Input, Output
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
 
 import phi
 from .dash_app import DashApp
 
 
-def build_app_details(dashapp):
-    assert isinstance(dashapp, DashApp)
-    app = dashapp.model
-    try:
-        app_file = inspect.getfile(app.__class__)
-    except TypeError:
-        app_file = 'Unknown'
-    return dcc.Markdown(f"""
+_PHIFLOW_VERSION = phi.__version__
+
+_PHIFLOW_INFO_SRC = f"""
+This application is based on the open-source simulation framework [Φ-Flow](https://github.com/tum-pbs/PhiFlow), version {_PHIFLOW_VERSION}.
+"""
+
+_APP_DETAILS_TEMPLATE = """
 ## Details
 
-Host: {socket.gethostname()}
+Host: {host}
 
 Script path: {app_file}
 
-Data path: {app.scene}
-    """)
+Data path: {scene}
+    """
 
+_DESCRIPTION_TEMPLATE = """
+# {title}
 
-def build_description(dashapp):
-    assert isinstance(dashapp, DashApp)
-    app = dashapp.model
-    md_src = _description_markdown_src(app.name, app.description)
-    return dcc.Markdown(children=md_src, id='info_markdown')
+---
 
+> **_About this application:_**
 
-def _description_markdown_src(title, subtitle=''):
-    if subtitle is not None and len(subtitle) > 0:
-        return """
-# %s
+{subtitle}
 
----
+---"""
 
-> **_About this application:_**
+_TITLE_TEMPLATE = '# {title}'
 
-%s
+_CLOCK_JS = """
+function(n_intervals, start, current) {
+    var elapsed = Math.max(0, Math.floor(Date.now() / 1000 - start.time));
+    var text = 'Application started: ' + start.ctime + ' (Running for ' + Math.floor(elapsed / 60) + ' minutes and ' + (elapsed % 60) + ' seconds)';
+    return text === current ? window.dash_clientside.no_update : text;
+}
+"""
 
----""" % (title, subtitle)
-    else:
-        return '# %s' % title
 
+def _cached_on_app(builder):
+    """ Builds the layout once per `DashApp`. Subsequent calls return the same component instance. """
+    @wraps(builder)
+    def cached_builder(dashapp: DashApp):
+        if builder.__name__ not in dashapp.component_cache:
+            dashapp.component_cache[builder.__name__] = builder(dashapp)
+        return dashapp.component_cache[builder.__name__]
+    return cached_builder
 
-def build_phiflow_info(dashapp):
-    root_dir = dirname(dirname(inspect.getfile(phi)))
-    setup_file = join(root_dir, 'setup.py')
-    version = phi.__version__
-    return dcc.Markdown(u"""
-This application is based on the open-source simulation framework [Φ-Flow](https://github.com/tum-pbs/PhiFlow), version %s.
-""" % version)
 
+@_cached_on_app
+def build_static_info(dashapp: DashApp):
+    """ PhiFlow version and app details as a single Markdown component. """
+    import socket
+    app = dashapp.model
+    app_file = _app_source_file(app.__class__)
+    return dcc.Markdown(_PHIFLOW_INFO_SRC + _APP_DETAILS_TEMPLATE.format(host=socket.gethostname(), app_file=app_file, scene=app.scene))
 
-def build_app_time(dashapp):
-    start_time = datetime.datetime.fromtimestamp(dashapp.model.start_time)
 
-    def build_text():
-        now = datetime.datetime.now()
-        elapsed = now - start_time
-        minutes, seconds = divmod(elapsed.seconds, 60)
-        return 'Application started: %s (Running for %d minutes and %d seconds)' % (start_time.ctime(), minutes, seconds)
+@lru_cache(maxsize=None)
+def _app_source_file(cls):
+    import inspect
+    try:
+        return inspect.getfile(cls)
+    except TypeError:
+        return 'Unknown'
+
+
+@_cached_on_app
+def build_description(dashapp: DashApp):
+    app = dashapp.model
+    md_src = _description_markdown_src(app.name, app.description)
+    return dcc.Markdown(children=md_src, id='info_markdown')
+
 
+@lru_cache(maxsize=32)
+def _description_markdown_src(title, subtitle=''):
+    if subtitle is not None and len(subtitle) > 0:
+        return _DESCRIPTION_TEMPLATE.format(title=title, subtitle=subtitle)
+    else:
+        return _TITLE_TEMPLATE.format(title=title)
+
+
+@_cached_on_app
+def build_app_time(dashapp: DashApp):
+    start_time = dashapp.model.start_time
+    start_ctime = time.ctime(start_time)
     layout = html.Div([
-        dcc.Markdown(children=build_text(), id='clock-output'),
+        dcc.Markdown(children=_clock_text(start_time, start_ctime), id='clock-output'),
+        dcc.Store(id='clock-start', data={'time': start_time, 'ctime': start_ctime}),
         dcc.Interval(id='clock', interval=1000)
     ])
+    # The clock is updated in the browser so the server does not have to handle a request every second.
+    dashapp.dash.clientside_callback(_CLOCK_JS, Output('clock-output', 'children'), [Input('clock', 'n_intervals')], [State('clock-start', 'data'), State('clock-output', 'children')])
+    return layout
 
-    @dashapp.dash.callback(Output('clock-output', 'children'), [Input('clock', 'n_intervals')])
-    def update_clock(_):
-        return build_text()
 
-    return layout
+def _clock_text(start_time: float, start_ctime: str):
+    """ Server-side equivalent of `_CLOCK_JS`, used for the initial render. """
+    minutes, seconds = divmod(max(0, int(time.time() - start_time)), 60)
+    return f'Application started: {start_ctime} (Running for {minutes} minutes and {seconds} seconds)'
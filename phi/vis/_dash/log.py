@@ -1,6 +1,5 @@
 
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html
 
 from .player_controls import STEP_COMPLETE
 from .dash_app import DashApp
@@ -1,7 +1,6 @@
 import numpy as np
 
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html
 from dash.dependencies import Input, Output
 
 from .dash_app import DashApp
@@ -1,7 +1,6 @@
 import traceback
 
-import dash_core_components as dcc
-import dash_html_components as html
+from dash import dcc, html
 from dash.dependencies import Input, Output
 from plotly import graph_objects
 